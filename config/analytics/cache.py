@@ -0,0 +1,26 @@
+from django.core.cache import cache
+
+# Analytics responses only change when an order completes, so a short TTL
+# plus a version bump on completion keeps polling dashboards cheap.
+ANALYTICS_CACHE_TIMEOUT = 60
+ANALYTICS_VERSION_KEY = 'analytics:version'
+
+
+def get_analytics_version():
+    """Return the current analytics cache version, initialising it if missing."""
+    cache.add(ANALYTICS_VERSION_KEY, 1, None)
+    return cache.get(ANALYTICS_VERSION_KEY, 1)
+
+
+def make_analytics_key(name, user_id, *parts):
+    """Build a versioned cache key for an analytics response."""
+    suffix = ':'.join(str(part) for part in parts)
+    return f"analytics:v{get_analytics_version()}:{name}:{user_id}:{suffix}"
+
+
+def invalidate_analytics_cache():
+    """Invalidate all cached analytics responses by bumping the version."""
+    try:
+        cache.incr(ANALYTICS_VERSION_KEY)
+    except ValueError:
+        cache.set(ANALYTICS_VERSION_KEY, 1, None)
@@ -0,0 +1,26 @@
+from django.db import transaction
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+from orders.models import Order
+from .cache import invalidate_analytics_cache
+
+
+@receiver(post_init, sender=Order)
+def remember_order_status(sender, instance, **kwargs):
+    """Record the status the order was loaded with to detect transitions."""
+    # Read __dict__ so a deferred status does not trigger a query per row
+    instance._loaded_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Order)
+def invalidate_analytics_on_order_completion(sender, instance, created, **kwargs):
+    """
+    Drop cached analytics once an order becomes completed.
+    Runs after commit so concurrent requests cannot re-cache the old state.
+    """
+    became_completed = instance.status == 'completed' and (
+        created or instance._loaded_status != 'completed'
+    )
+    instance._loaded_status = instance.status
+    if became_completed:
+        transaction.on_commit(invalidate_analytics_cache)
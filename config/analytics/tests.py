@@ -1,3 +1,37 @@
+from decimal import Decimal
+from django.contrib.auth.models import User
 from django.test import TestCase
+from orders.models import Order
+from .cache import get_analytics_version
 
-# Create your tests here.
+
+class AnalyticsInvalidationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='buyer', password='pass')
+        self.order = Order.objects.create(
+            user=self.user,
+            total_amount=Decimal('100.00'),
+            amount_paid=Decimal('150.00'),
+        )
+
+    def test_completion_invalidates_after_commit(self):
+        version = get_analytics_version()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.order.complete()
+        self.assertEqual(get_analytics_version(), version)
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+        self.assertEqual(get_analytics_version(), version + 1)
+
+    def test_saving_completed_order_again_does_not_invalidate(self):
+        self.order.complete()
+        order = Order.objects.get(pk=self.order.pk)
+        with self.captureOnCommitCallbacks() as callbacks:
+            order.save()
+        self.assertEqual(callbacks, [])
+
+    def test_pending_order_does_not_invalidate(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.order.save()
+        self.assertEqual(callbacks, [])
@@ -7,7 +7,8 @@ from django.db.models.functions import TruncDate
 from products.models import Product
 from orders.models import Order, OrderItem
 from datetime import datetime, timedelta
-from functools import reduce
+from django.core.cache import cache
+from .cache import ANALYTICS_CACHE_TIMEOUT, make_analytics_key
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,12 @@ class DashboardStatsView(APIView):
         """
         # Date filter (default: last 30 days)
         days = int(request.query_params.get('days', 30))
+        
+        cache_key = make_analytics_key('dashboard', request.user.id, days)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response({'success': True, 'data': data})
+        
         start_date = datetime.now() - timedelta(days=days)
         
         # Order statistics
@@ -56,14 +63,20 @@ class DashboardStatsView(APIView):
             order_count=Count('order', distinct=True)
         ).order_by('-total_quantity')
         
+        # Run the aggregation once and slice in memory
+        product_stats_list = list(product_stats)
+        
         # Most ordered products
-        most_ordered = list(product_stats[:10])
+        most_ordered = product_stats_list[:10]
         
         # Least ordered products (with at least one order)
-        least_ordered = list(product_stats.order_by('total_quantity')[:10])
+        least_ordered = sorted(
+            product_stats_list,
+            key=lambda x: x['total_quantity'] or 0
+        )[:10]
         
         # Products never ordered
-        ordered_product_ids = set(map(lambda x: x['product__id'], product_stats))
+        ordered_product_ids = {x['product__id'] for x in product_stats_list}
         never_ordered = Product.objects.filter(
             is_active=True
         ).exclude(
@@ -80,33 +93,33 @@ class DashboardStatsView(APIView):
             ).order_by('date')
         )
         
-        # Transform data using functional programming
-        frequency_data = list(map(
-            lambda item: {
+        # Transform data for the response
+        frequency_data = [
+            {
                 'date': item['date'].isoformat(),
                 'orders': item['count'],
                 'revenue': str(item['revenue'])
+            }
+            for item in order_frequency
+        ]
+        
+        data = {
+            'summary': {
+                'total_orders': total_orders,
+                'total_revenue': str(total_revenue),
+                'formatted_revenue': f'UGX {total_revenue:,.2f}',
+                'average_order_value': str(avg_order_value),
+                'formatted_avg': f'UGX {avg_order_value:,.2f}',
+                'period_days': days
             },
-            order_frequency
-        ))
+            'most_ordered_products': most_ordered,
+            'least_ordered_products': least_ordered,
+            'never_ordered_products': list(never_ordered),
+            'order_frequency': frequency_data,
+        }
+        cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
         
-        return Response({
-            'success': True,
-            'data': {
-                'summary': {
-                    'total_orders': total_orders,
-                    'total_revenue': str(total_revenue),
-                    'formatted_revenue': f'UGX {total_revenue:,.2f}',
-                    'average_order_value': str(avg_order_value),
-                    'formatted_avg': f'UGX {avg_order_value:,.2f}',
-                    'period_days': days
-                },
-                'most_ordered_products': most_ordered,
-                'least_ordered_products': least_ordered,
-                'never_ordered_products': list(never_ordered),
-                'order_frequency': frequency_data,
-            }
-        })
+        return Response({'success': True, 'data': data})
 
 
 class ProductAnalyticsView(APIView):
@@ -121,56 +134,63 @@ class ProductAnalyticsView(APIView):
         Detailed analytics for each product.
         Helps determine pricing strategies and discounts.
         """
-        products = Product.objects.filter(is_active=True).annotate(
+        cache_key = make_analytics_key('products', request.user.id)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response({'success': True, 'data': data})
+        
+        # Select only the columns used below instead of hydrating full models
+        products = Product.objects.filter(is_active=True).values(
+            'id', 'name', 'price', 'stock_quantity'
+        ).annotate(
             orders_count=Count('orderitem__order', distinct=True),
             total_sold=Sum('orderitem__quantity'),
             revenue=Sum('orderitem__subtotal')
         ).order_by('-total_sold')
         
-        # Categorize products using functional programming
-        high_performers = list(filter(
-            lambda p: (p.total_sold or 0) > 10,
-            products
-        ))
-        
-        low_performers = list(filter(
-            lambda p: 0 < (p.total_sold or 0) <= 5,
-            products
-        ))
-        
-        no_sales = list(filter(
-            lambda p: (p.total_sold or 0) == 0,
-            products
-        ))
-        
         # Transform to dictionaries
         transform_product = lambda p: {
-            'id': p.id,
-            'name': p.name,
-            'price': str(p.price),
-            'formatted_price': f'UGX {p.price:,.2f}',
-            'stock_quantity': p.stock_quantity,
-            'total_sold': p.total_sold or 0,
-            'orders_count': p.orders_count or 0,
-            'revenue': str(p.revenue or 0),
-            'formatted_revenue': f'UGX {(p.revenue or 0):,.2f}',
+            'id': p['id'],
+            'name': p['name'],
+            'price': str(p['price']),
+            'formatted_price': f"UGX {p['price']:,.2f}",
+            'stock_quantity': p['stock_quantity'],
+            'total_sold': p['total_sold'] or 0,
+            'orders_count': p['orders_count'] or 0,
+            'revenue': str(p['revenue'] or 0),
+            'formatted_revenue': f"UGX {(p['revenue'] or 0):,.2f}",
             'recommendation': self._get_product_recommendation(p)
         }
         
-        return Response({
-            'success': True,
-            'data': {
-                'all_products': [transform_product(p) for p in products],
-                'high_performers': [transform_product(p) for p in high_performers],
-                'low_performers': [transform_product(p) for p in low_performers],
-                'no_sales': [transform_product(p) for p in no_sales],
-                'insights': {
-                    'high_performers_count': len(high_performers),
-                    'low_performers_count': len(low_performers),
-                    'no_sales_count': len(no_sales)
-                }
+        # Categorize products in a single pass, transforming each once.
+        # Stream rows in chunks so large catalogs are not held in memory twice.
+        all_products, high_performers, low_performers, no_sales = [], [], [], []
+        for p in products.iterator(chunk_size=500):
+            product_data = transform_product(p)
+            all_products.append(product_data)
+            
+            total_sold = product_data['total_sold']
+            if total_sold > 10:
+                high_performers.append(product_data)
+            elif 0 < total_sold <= 5:
+                low_performers.append(product_data)
+            elif total_sold == 0:
+                no_sales.append(product_data)
+        
+        data = {
+            'all_products': all_products,
+            'high_performers': high_performers,
+            'low_performers': low_performers,
+            'no_sales': no_sales,
+            'insights': {
+                'high_performers_count': len(high_performers),
+                'low_performers_count': len(low_performers),
+                'no_sales_count': len(no_sales)
             }
-        })
+        }
+        cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+        
+        return Response({'success': True, 'data': data})
     
     @staticmethod
     def _get_product_recommendation(product):
@@ -178,8 +198,8 @@ class ProductAnalyticsView(APIView):
         Get recommendation for product based on performance.
         Helper function using business logic.
         """
-        total_sold = product.total_sold or 0
-        stock = product.stock_quantity
+        total_sold = product['total_sold'] or 0
+        stock = product['stock_quantity']
         
         if total_sold == 0:
             return 'Consider offering discount or promotion'
@@ -206,6 +226,12 @@ class RevenueAnalysisView(APIView):
         Useful for business decision making.
         """
         days = int(request.query_params.get('days', 30))
+        
+        cache_key = make_analytics_key('revenue', request.user.id, days)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response({'success': True, 'data': data})
+        
         start_date = datetime.now() - timedelta(days=days)
         
         # Daily revenue
@@ -220,7 +246,7 @@ class RevenueAnalysisView(APIView):
             avg_order=Avg('total_amount')
         ).order_by('date')
         
-        # Calculate growth using reduce
+        # Calculate growth from the first and last day
         revenue_list = list(daily_revenue)
         
         if len(revenue_list) > 1:
@@ -230,31 +256,27 @@ class RevenueAnalysisView(APIView):
         else:
             growth_rate = 0
         
-        total = reduce(
-            lambda acc, item: acc + float(item['revenue']),
-            revenue_list,
-            0
-        )
+        total = sum(float(item['revenue']) for item in revenue_list)
         
-        return Response({
-            'success': True,
-            'data': {
-                'daily_revenue': [
-                    {
-                        'date': item['date'].isoformat(),
-                        'revenue': str(item['revenue']),
-                        'formatted_revenue': f"UGX {item['revenue']:,.2f}",
-                        'orders': item['orders'],
-                        'avg_order': str(item['avg_order']),
-                        'formatted_avg': f"UGX {item['avg_order']:,.2f}"
-                    }
-                    for item in revenue_list
-                ],
-                'summary': {
-                    'total_revenue': str(total),
-                    'formatted_total': f'UGX {total:,.2f}',
-                    'growth_rate': round(growth_rate, 2),
-                    'period_days': days
+        data = {
+            'daily_revenue': [
+                {
+                    'date': item['date'].isoformat(),
+                    'revenue': str(item['revenue']),
+                    'formatted_revenue': f"UGX {item['revenue']:,.2f}",
+                    'orders': item['orders'],
+                    'avg_order': str(item['avg_order']),
+                    'formatted_avg': f"UGX {item['avg_order']:,.2f}"
                 }
+                for item in revenue_list
+            ],
+            'summary': {
+                'total_revenue': str(total),
+                'formatted_total': f'UGX {total:,.2f}',
+                'growth_rate': round(growth_rate, 2),
+                'period_days': days
             }
-        })
\ No newline at end of file
+        }
+        cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+        
+        return Response({'success': True, 'data': data})
\ No newline at end of file
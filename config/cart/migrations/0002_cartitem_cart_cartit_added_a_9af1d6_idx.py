@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-14 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cart', '0001_initial'),
+        ('products', '0003_item_price'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cartitem',
+            index=models.Index(fields=['-added_at'], name='cart_cartit_added_a_9af1d6_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
+from django.db.models import Sum, F, DecimalField
 from decimal import Decimal
-from functools import reduce
+from functools import reduce, cached_property
 from products.models import Item
 
 class Cart(models.Model):
@@ -13,30 +14,52 @@ class Cart(models.Model):
         return f"Cart {self.created_at}"
 
     def get_items(self):
+        # Reuse items prefetched by the view (to_attr='prefetched_items')
+        # instead of issuing a new query.
+        prefetched = getattr(self, 'prefetched_items', None)
+        if prefetched is not None:
+            return prefetched
         return self.items.select_related('item').all()
 
+    @cached_property
     def calculate_total(self):
-        items = self.get_items()
-        total = reduce(lambda acc, item: acc + item.get_subtotal(), items, Decimal('0.00'))
-        return total
+        # Cached for the lifetime of the instance, which is a single request.
+        prefetched = getattr(self, 'prefetched_items', None)
+        if prefetched is not None:
+            return reduce(lambda acc, item: acc + item.get_subtotal(), prefetched, Decimal('0.00'))
+
+        # Let the database multiply and sum instead of iterating items in Python.
+        total = self.items.aggregate(
+            total=Sum(
+                F('quantity') * F('item__price'),
+                output_field=DecimalField(max_digits=14, decimal_places=2)
+            )
+        )['total']
+        return total or Decimal('0.00')
 
     def get_item_count(self):
-        items = self.get_items()
-        return sum(item.quantity for item in items)
+        prefetched = getattr(self, 'prefetched_items', None)
+        if prefetched is not None:
+            return sum(item.quantity for item in prefetched)
+        return self.items.aggregate(count=Sum('quantity'))['count'] or 0
 
     def clear(self):
-        self.items.all().delete()
+        """Delete all items and return how many were removed."""
+        return self.items.all().delete()[0]
 
     def to_dict(self):
-        items_data = [item.to_dict() for item in self.get_items()]
+        # Fetch items and compute the total once; each call used to re-query.
+        items = list(self.get_items())
+        total = reduce(lambda acc, item: acc + item.get_subtotal(), items, Decimal('0.00'))
+        items_data = [item.to_dict() for item in items]
         return {
             'id': self.id,
             'items': items_data,
             'item_count': len(items_data),
             'total_quantity': sum(i['quantity'] for i in items_data),
-            'subtotal': str(self.calculate_total()),
-            'total': str(self.calculate_total()),
-            'formatted_total': f"UGX {self.calculate_total():,.2f}",
+            'subtotal': str(total),
+            'total': str(total),
+            'formatted_total': f"UGX {total:,.2f}",
         }
 
 
@@ -50,6 +73,9 @@ class CartItem(models.Model):
     class Meta:
         unique_together = ('cart', 'item')  # <- ok
         ordering = ['-added_at']
+        indexes = [
+            models.Index(fields=['-added_at']),
+        ]
 
 
     def __str__(self):
@@ -59,16 +85,19 @@ class CartItem(models.Model):
         return Decimal(self.item.price) * self.quantity
 
     def to_dict(self):
+        item = self.item
+        price = item.price
+        subtotal = self.get_subtotal()
         return {
             'id': self.id,
             'item': {
-                'id': self.item.id,
-                'name': self.item.name,
-                'price': str(self.item.price),
-                'formatted_price': f"UGX {self.item.price:,.2f}",
-                'photo': self.item.photo.url if self.item.photo else None,
+                'id': item.id,
+                'name': item.name,
+                'price': str(price),
+                'formatted_price': f"UGX {price:,.2f}",
+                'photo': item.photo.url if item.photo else None,
             },
             'quantity': self.quantity,
-            'subtotal': str(self.get_subtotal()),
-            'formatted_subtotal': f"UGX {self.get_subtotal():,.2f}",
+            'subtotal': str(subtotal),
+            'formatted_subtotal': f"UGX {subtotal:,.2f}",
         }
@@ -9,11 +9,16 @@ class AddToCartSerializer(serializers.Serializer):
     item_id = serializers.IntegerField(required=True)
     quantity = serializers.IntegerField(required=True, min_value=1)
 
-    def validate_item_id(self, value):
-        """Ensure item exists."""
-        if not Item.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Item not found.")
-        return value
+    def validate(self, attrs):
+        """
+        Ensure item exists.
+        The fetched item is returned in validated_data so the view does not re-query it.
+        """
+        try:
+            attrs['item'] = Item.objects.only('id', 'name').get(id=attrs['item_id'])
+        except Item.DoesNotExist:
+            raise serializers.ValidationError({'item_id': "Item not found."})
+        return attrs
 
 
 class UpdateCartItemSerializer(serializers.Serializer):
@@ -66,34 +71,30 @@ class CartItemSerializer(serializers.ModelSerializer):
 class CartSerializer(serializers.ModelSerializer):
     """
     Serializer for the whole cart.
+    Totals are computed once per cart in to_representation.
     """
-    items = CartItemSerializer(many=True, read_only=True)
-    total = serializers.SerializerMethodField()
-    formatted_total = serializers.SerializerMethodField()
-    item_count = serializers.SerializerMethodField()
-    total_quantity = serializers.SerializerMethodField()
+    items = CartItemSerializer(source='get_items', many=True, read_only=True)
 
     class Meta:
         model = Cart
         fields = [
             'id',
             'items',
-            'item_count',
-            'total_quantity',
-            'total',
-            'formatted_total',
             'created_at',
             'updated_at',
         ]
 
-    def get_total(self, obj):
-        return str(obj.calculate_total())
-
-    def get_formatted_total(self, obj):
-        return f"UGX {obj.calculate_total():,.2f}"
-
-    def get_item_count(self, obj):
-        return obj.get_items().count()
-
-    def get_total_quantity(self, obj):
-        return obj.get_item_count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        items = instance.get_items()  # uses prefetched items when present
+        total = instance.calculate_total
+        return {
+            'id': data['id'],
+            'items': data['items'],
+            'item_count': len(items),
+            'total_quantity': instance.get_item_count(),
+            'total': str(total),
+            'formatted_total': f"UGX {total:,.2f}",
+            'created_at': data['created_at'],
+            'updated_at': data['updated_at'],
+        }
@@ -1,3 +1,34 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from products.models import Item
+from .models import CartItem
 
-# Create your tests here.
+
+class CartAddItemTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.item = Item.objects.create(name='Mug', price=1500)
+
+    def test_add_item_creates_cart_item(self):
+        response = self.client.post(
+            reverse('cart-add-item'), {'item_id': self.item.id, 'quantity': 2}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['message'], 'Mug added to cart')
+        self.assertEqual(CartItem.objects.get(item=self.item).quantity, 2)
+
+    def test_add_existing_item_increments_quantity(self):
+        url = reverse('cart-add-item')
+        self.client.post(url, {'item_id': self.item.id, 'quantity': 2}, format='json')
+        response = self.client.post(url, {'item_id': self.item.id, 'quantity': 3}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(CartItem.objects.get(item=self.item).quantity, 5)
+
+    def test_add_unknown_item_is_rejected(self):
+        response = self.client.post(
+            reverse('cart-add-item'), {'item_id': 999, 'quantity': 1}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(CartItem.objects.exists())
@@ -1,54 +1,84 @@
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.response import Response
+from django.core.cache import cache
 from django.db import transaction
-from django.shortcuts import get_object_or_404
-from .models import Cart, CartItem, Item  # Use your Item model
+from django.db.models import Prefetch
+from .models import Cart, CartItem
 from .serializers import AddToCartSerializer, UpdateCartItemSerializer
 from decimal import Decimal
 import logging
 
 logger = logging.getLogger(__name__)
 
+VOLATILE_CART_CACHE_KEY = 'volatile_cart_exists'
+
 # -------------------------------
 # Helper: Volatile Cart (single instance)
 # -------------------------------
-def get_or_create_volatile_cart():
+def get_or_create_volatile_cart(prefetch_items=True):
     """
     Get or create a single cart for volatile (unauthenticated) use.
     Always uses Cart with id=1, creates if not exists.
+    Items are prefetched with their Item so serialization needs no extra queries;
+    views that mutate items pass prefetch_items=False so to_dict reads them fresh.
+    Once the cart is known to exist, a plain SELECT replaces get_or_create.
     """
-    cart, created = Cart.objects.get_or_create(id=1)
+    queryset = Cart.objects.all()
+    if prefetch_items:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                'items',
+                queryset=CartItem.objects.select_related('item'),
+                to_attr='prefetched_items'
+            )
+        )
+    if cache.get(VOLATILE_CART_CACHE_KEY):
+        try:
+            return queryset.get(id=1)
+        except Cart.DoesNotExist:
+            pass
+
+    cart, created = queryset.get_or_create(id=1)
     if created:
         logger.info("Created volatile cart (id=1)")
+    cache.set(VOLATILE_CART_CACHE_KEY, True, None)
     return cart
 
+
+class VolatileCartMixin:
+    """Give cart views a per-request cached volatile cart."""
+
+    def get_cart(self, prefetch_items=True):
+        if not hasattr(self, '_cart'):
+            self._cart = get_or_create_volatile_cart(prefetch_items=prefetch_items)
+        return self._cart
+
 # -------------------------------
 # Cart Views
 # -------------------------------
 
-class CartListView(APIView):
+class CartListView(VolatileCartMixin, APIView):
     """List all items in the volatile cart."""
     
     def get(self, request):
-        cart = get_or_create_volatile_cart()
+        cart = self.get_cart()
         cart_data = cart.to_dict()
         return Response({"success": True, "data": cart_data})
 
 
-class CartAddItemView(APIView):
+class CartAddItemView(VolatileCartMixin, APIView):
     """Add an item to the volatile cart or increase quantity."""
 
     def post(self, request):
         serializer = AddToCartSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        item_id = serializer.validated_data['item_id']  # <-- fixed
+        item = serializer.validated_data['item']  # fetched during validation
         quantity = serializer.validated_data['quantity']
 
         with transaction.atomic():
-            cart = get_or_create_volatile_cart()
-            item = get_object_or_404(Item, id=item_id)
+            cart = self.get_cart(prefetch_items=False)
 
             cart_item, created = CartItem.objects.get_or_create(
                 cart=cart,
@@ -58,9 +88,8 @@ class CartAddItemView(APIView):
 
             if not created:
                 cart_item.quantity += quantity
-                cart_item.save()
+                cart_item.save(update_fields=['quantity', 'updated_at'])
 
-            cart.refresh_from_db()
             cart_data = cart.to_dict()
 
         return Response({
@@ -71,7 +100,7 @@ class CartAddItemView(APIView):
 
 
 
-class CartUpdateItemView(APIView):
+class CartUpdateItemView(VolatileCartMixin, APIView):
     """Update quantity of an item in the volatile cart."""
 
     def put(self, request, item_id):
@@ -81,12 +110,17 @@ class CartUpdateItemView(APIView):
         quantity = serializer.validated_data['quantity']
 
         with transaction.atomic():
-            cart = get_or_create_volatile_cart()
-            cart_item = get_object_or_404(CartItem, id=item_id, cart=cart)
+            cart = self.get_cart(prefetch_items=False)
+            try:
+                cart_item = CartItem.objects.select_related('item').get(id=item_id, cart=cart)
+            except CartItem.DoesNotExist:
+                return Response({
+                    "success": False,
+                    "error": "Cart item not found"
+                }, status=status.HTTP_404_NOT_FOUND)
             cart_item.quantity = quantity
-            cart_item.save()
+            cart_item.save(update_fields=['quantity', 'updated_at'])
 
-            cart.refresh_from_db()
             cart_data = cart.to_dict()
 
         return Response({
@@ -96,17 +130,22 @@ class CartUpdateItemView(APIView):
         })
 
 
-class CartRemoveItemView(APIView):
+class CartRemoveItemView(VolatileCartMixin, APIView):
     """Remove an item from the volatile cart."""
 
     def delete(self, request, item_id):
         with transaction.atomic():
-            cart = get_or_create_volatile_cart()
-            cart_item = get_object_or_404(CartItem, id=item_id, cart=cart)
-            item_name = cart_item.product.name
+            cart = self.get_cart(prefetch_items=False)
+            try:
+                cart_item = CartItem.objects.select_related('item').get(id=item_id, cart=cart)
+            except CartItem.DoesNotExist:
+                return Response({
+                    "success": False,
+                    "error": "Cart item not found"
+                }, status=status.HTTP_404_NOT_FOUND)
+            item_name = cart_item.item.name
             cart_item.delete()
 
-            cart.refresh_from_db()
             cart_data = cart.to_dict()
 
         return Response({
@@ -116,13 +155,15 @@ class CartRemoveItemView(APIView):
         })
 
 
-class CartClearView(APIView):
+class CartClearView(VolatileCartMixin, APIView):
     """Clear all items from the volatile cart."""
 
     def delete(self, request):
         with transaction.atomic():
-            cart = get_or_create_volatile_cart()
-            cart.clear()
+            cart = self.get_cart(prefetch_items=False)
+            items_count = cart.clear()
+
+        logger.info(f"Cleared {items_count} items from volatile cart (id={cart.id})")
 
         return Response({
             "success": True,
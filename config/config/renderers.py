@@ -0,0 +1,31 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import orjson
+
+# DRF's encoder handles the types orjson leaves to a default hook
+# (Decimal, lazy strings, querysets) and keeps DRF's datetime format.
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, falling back to JSONRenderer for payloads orjson rejects.
+    Known differences: NaN/Infinity render as null instead of raising, and generators are consumed.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(data, default=_fallback_encoder.default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028/U+2029 like JSONRenderer so the output is safe inside <script>
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,26 @@
+import datetime
+from decimal import Decimal
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def assertMatchesJSONRenderer(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_int_keys(self):
+        self.assertMatchesJSONRenderer({1: 'x', 'nested': {2: 'y'}})
+
+    def test_decimal_and_datetime_values(self):
+        self.assertMatchesJSONRenderer({
+            'price': Decimal('1500.50'),
+            'at': datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            'on': datetime.date(2024, 1, 2),
+        })
+
+    def test_line_separators_are_escaped(self):
+        self.assertMatchesJSONRenderer({'text': 'a b c'})
+
+    def test_wide_ints_fall_back(self):
+        self.assertMatchesJSONRenderer({'big': 2 ** 70})
@@ -10,7 +10,6 @@ logger = logging.getLogger(__name__)
 def custom_exception_handler(exc, context):
     """
     Custom exception handler that provides consistent error responses.
-    Uses functional programming to transform errors.
     """
     response = exception_handler(exc, context)
     
@@ -25,19 +24,17 @@ def custom_exception_handler(exc, context):
             }
         }
         
-        # Extract error messages using functional approach
+        # Extract error messages in a single pass, skipping it when detail is set
         if isinstance(response.data, dict):
-            error_messages = list(map(
-                lambda item: f"{item[0]}: {item[1][0]}" if isinstance(item[1], list) else f"{item[0]}: {item[1]}",
-                filter(lambda item: item[0] != 'detail', response.data.items())
-            ))
-            
             if 'detail' in response.data:
                 error_data['error']['message'] = str(response.data['detail'])
-            elif error_messages:
-                error_data['error']['message'] = '; '.join(error_messages)
             else:
-                error_data['error']['message'] = 'An error occurred'
+                error_messages = []
+                for field, value in response.data.items():
+                    error_messages.append(
+                        f"{field}: {value[0] if isinstance(value, list) else value}"
+                    )
+                error_data['error']['message'] = '; '.join(error_messages) or 'An error occurred'
                 
             error_data['error']['details'] = response.data
         else:
@@ -0,0 +1,31 @@
+import hashlib
+from django.core.cache import cache
+
+# A user's order history only changes on checkout, so list responses are
+# cached under a per-user version that CheckoutView bumps.
+ORDER_LIST_CACHE_TIMEOUT = 300
+
+
+def _version_key(user_id):
+    return f"orders:list:{user_id}:version"
+
+
+def make_order_list_key(user_id, order_status=None, cursor=''):
+    """
+    Build a versioned cache key for one page of a user's order list.
+    Status and cursor come from the query string, so they are hashed to keep
+    the key short and free of characters memcached rejects.
+    """
+    version_key = _version_key(user_id)
+    cache.add(version_key, 1, None)
+    version = cache.get(version_key, 1)
+    digest = hashlib.md5(f"{order_status or 'all'}|{cursor}".encode()).hexdigest()
+    return f"orders:list:{user_id}:v{version}:{digest}"
+
+
+def invalidate_order_list_cache(user_id):
+    """Invalidate every cached order list for the user."""
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), 1, None)
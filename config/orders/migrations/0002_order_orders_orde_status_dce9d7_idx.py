@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-14 11:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'completed_at'], name='orders_orde_status_dce9d7_idx'),
+        ),
+    ]
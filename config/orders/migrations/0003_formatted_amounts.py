@@ -0,0 +1,61 @@
+# Generated by Django 5.0 on 2026-10-14 11:18
+
+from django.db import migrations, models
+
+
+def populate_formatted_amounts(apps, schema_editor):
+    Order = apps.get_model('orders', 'Order')
+    OrderItem = apps.get_model('orders', 'OrderItem')
+
+    orders = list(Order.objects.all())
+    for order in orders:
+        order.formatted_total = f"UGX {order.total_amount:,.2f}"
+        order.formatted_paid = f"UGX {order.amount_paid:,.2f}"
+        order.formatted_change = f"UGX {order.change_amount:,.2f}"
+    Order.objects.bulk_update(
+        orders, ['formatted_total', 'formatted_paid', 'formatted_change'], batch_size=500
+    )
+
+    items = list(OrderItem.objects.all())
+    for item in items:
+        item.formatted_price = f"UGX {item.product_price:,.2f}"
+        item.formatted_subtotal = f"UGX {item.subtotal:,.2f}"
+    OrderItem.objects.bulk_update(
+        items, ['formatted_price', 'formatted_subtotal'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_orders_orde_status_dce9d7_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='formatted_change',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='formatted_paid',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='formatted_total',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='formatted_price',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='formatted_subtotal',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.RunPython(populate_formatted_amounts, migrations.RunPython.noop),
+    ]
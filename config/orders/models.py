@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from django.db.models import Sum
 from products.models import Product
 from decimal import Decimal
 from functools import reduce
@@ -37,6 +38,11 @@ class Order(models.Model):
         default=Decimal('0.00')
     )
     
+    # Display strings, stored on save so reads never re-format the amounts
+    formatted_total = models.CharField(max_length=32, blank=True, editable=False)
+    formatted_paid = models.CharField(max_length=32, blank=True, editable=False)
+    formatted_change = models.CharField(max_length=32, blank=True, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -47,6 +53,7 @@ class Order(models.Model):
         indexes = [
             models.Index(fields=['-created_at', 'user']),
             models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['status', 'completed_at']),
         ]
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
@@ -84,29 +91,54 @@ class Order(models.Model):
         self.completed_at = timezone.now()
         self.save()
     
+    def set_formatted_amounts(self):
+        """Populate the stored display strings from the current amounts."""
+        self.formatted_total = f"UGX {self.total_amount:,.2f}"
+        self.formatted_paid = f"UGX {self.amount_paid:,.2f}"
+        self.formatted_change = f"UGX {self.change_amount:,.2f}"
+    
+    def save(self, *args, **kwargs):
+        """
+        Override save to store formatted amounts.
+        Keeps the display strings in sync with the amounts.
+        """
+        self.set_formatted_amounts()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {
+                *update_fields, 'formatted_total', 'formatted_paid', 'formatted_change'
+            }
+        super().save(*args, **kwargs)
+    
     def get_total_items(self):
-        """Get total number of items using functional programming."""
-        return sum(map(lambda item: item.quantity, self.items.all()))
+        """
+        Get total number of items.
+        Sums in the database unless the items are already prefetched.
+        """
+        if 'items' in getattr(self, '_prefetched_objects_cache', {}):
+            return sum(item.quantity for item in self.items.all())
+        return self.items.aggregate(total=Sum('quantity'))['total'] or 0
     
     def to_dict(self):
         """
         Convert order to dictionary.
         Includes all payment calculations.
         """
-        items = self.items.select_related('product').all()
+        items = list(self.items.select_related('product').all())
+        total_items = sum(item.quantity for item in items)
         
         return {
             'id': self.id,
             'status': self.status,
             'items': [item.to_dict() for item in items],
             'total_amount': str(self.total_amount),
-            'formatted_total': f"UGX {self.total_amount:,.2f}",
+            'formatted_total': self.formatted_total,
             'amount_paid': str(self.amount_paid),
-            'formatted_paid': f"UGX {self.amount_paid:,.2f}",
+            'formatted_paid': self.formatted_paid,
             'change_amount': str(self.change_amount),
-            'formatted_change': f"UGX {self.change_amount:,.2f}",
+            'formatted_change': self.formatted_change,
             'can_complete': self.can_complete(),
-            'total_items': self.get_total_items(),
+            'total_items': total_items,
             'created_at': self.created_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
         }
@@ -126,6 +158,10 @@ class OrderItem(models.Model):
     quantity = models.PositiveIntegerField(validators=[MinValueValidator(1)])
     subtotal = models.DecimalField(max_digits=12, decimal_places=2)
     
+    # Display strings, stored on save so reads never re-format the amounts
+    formatted_price = models.CharField(max_length=32, blank=True, editable=False)
+    formatted_subtotal = models.CharField(max_length=32, blank=True, editable=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -141,14 +177,28 @@ class OrderItem(models.Model):
     
     def calculate_subtotal(self):
         """Calculate subtotal for this item."""
-        return self.product_price * Decimal(str(self.quantity))
+        return self.product_price * self.quantity
+    
+    def set_computed_fields(self):
+        """
+        Populate subtotal and the stored display strings.
+        Call directly before bulk_create, which bypasses save().
+        """
+        self.subtotal = self.calculate_subtotal()
+        self.formatted_price = f"UGX {self.product_price:,.2f}"
+        self.formatted_subtotal = f"UGX {self.subtotal:,.2f}"
     
     def save(self, *args, **kwargs):
         """
         Override save to calculate subtotal.
         Ensures data consistency.
         """
-        self.subtotal = self.calculate_subtotal()
+        self.set_computed_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {
+                *update_fields, 'subtotal', 'formatted_price', 'formatted_subtotal'
+            }
         super().save(*args, **kwargs)
     
     def to_dict(self):
@@ -158,8 +208,8 @@ class OrderItem(models.Model):
             'product_id': self.product.id,
             'product_name': self.product_name,
             'product_price': str(self.product_price),
-            'formatted_price': f"UGX {self.product_price:,.2f}",
+            'formatted_price': self.formatted_price,
             'quantity': self.quantity,
             'subtotal': str(self.subtotal),
-            'formatted_subtotal': f"UGX {self.subtotal:,.2f}",
+            'formatted_subtotal': self.formatted_subtotal,
         }
\ No newline at end of file
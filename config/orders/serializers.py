@@ -34,9 +34,10 @@ class CheckoutSerializer(serializers.Serializer):
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
-    """Serializer for order items."""
-    formatted_price = serializers.SerializerMethodField()
-    formatted_subtotal = serializers.SerializerMethodField()
+    """
+    Serializer for order items.
+    Builds the output dict directly to skip per-field resolution.
+    """
     
     class Meta:
         model = OrderItem
@@ -45,30 +46,30 @@ class OrderItemSerializer(serializers.ModelSerializer):
             'product',
             'product_name',
             'product_price',
-            'formatted_price',
             'quantity',
             'subtotal',
-            'formatted_subtotal',
         ]
     
-    def get_formatted_price(self, obj):
-        return f"UGX {obj.product_price:,.2f}"
-    
-    def get_formatted_subtotal(self, obj):
-        return f"UGX {obj.subtotal:,.2f}"
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'product': instance.product_id,
+            'product_name': instance.product_name,
+            'product_price': str(instance.product_price),
+            'formatted_price': instance.formatted_price,
+            'quantity': instance.quantity,
+            'subtotal': str(instance.subtotal),
+            'formatted_subtotal': instance.formatted_subtotal,
+        }
 
 
 class OrderSerializer(serializers.ModelSerializer):
     """
     Complete order serializer.
     Includes all items and payment calculations.
+    Derived values are added in one pass in to_representation.
     """
     items = OrderItemSerializer(many=True, read_only=True)
-    formatted_total = serializers.SerializerMethodField()
-    formatted_paid = serializers.SerializerMethodField()
-    formatted_change = serializers.SerializerMethodField()
-    can_complete = serializers.SerializerMethodField()
-    total_items = serializers.SerializerMethodField()
     
     class Meta:
         model = Order
@@ -77,13 +78,8 @@ class OrderSerializer(serializers.ModelSerializer):
             'status',
             'items',
             'total_amount',
-            'formatted_total',
             'amount_paid',
-            'formatted_paid',
             'change_amount',
-            'formatted_change',
-            'can_complete',
-            'total_items',
             'created_at',
             'completed_at',
         ]
@@ -94,20 +90,23 @@ class OrderSerializer(serializers.ModelSerializer):
             'completed_at',
         ]
     
-    def get_formatted_total(self, obj):
-        return f"UGX {obj.total_amount:,.2f}"
-    
-    def get_formatted_paid(self, obj):
-        return f"UGX {obj.amount_paid:,.2f}"
-    
-    def get_formatted_change(self, obj):
-        return f"UGX {obj.change_amount:,.2f}"
-    
-    def get_can_complete(self, obj):
-        return obj.can_complete()
-    
-    def get_total_items(self, obj):
-        return obj.get_total_items()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        return {
+            'id': data['id'],
+            'status': data['status'],
+            'items': data['items'],
+            'total_amount': data['total_amount'],
+            'formatted_total': instance.formatted_total,
+            'amount_paid': data['amount_paid'],
+            'formatted_paid': instance.formatted_paid,
+            'change_amount': data['change_amount'],
+            'formatted_change': instance.formatted_change,
+            'can_complete': instance.can_complete(),
+            'total_items': instance.get_total_items(),
+            'created_at': data['created_at'],
+            'completed_at': data['completed_at'],
+        }
 
 
 class OrderListSerializer(serializers.ModelSerializer):
@@ -115,7 +114,6 @@ class OrderListSerializer(serializers.ModelSerializer):
     Lightweight serializer for order lists.
     Optimized for performance.
     """
-    formatted_total = serializers.SerializerMethodField()
     item_count = serializers.SerializerMethodField()
     
     class Meta:
@@ -130,8 +128,5 @@ class OrderListSerializer(serializers.ModelSerializer):
             'completed_at',
         ]
     
-    def get_formatted_total(self, obj):
-        return f"UGX {obj.total_amount:,.2f}"
-    
     def get_item_count(self, obj):
-        return obj.items.count()
\ No newline at end of file
+        return obj.item_count  # annotated by OrderListView
\ No newline at end of file
@@ -1,3 +1,108 @@
+from decimal import Decimal
+from unittest import mock
+from urllib.parse import urlparse
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+from products.models import Product
+from .cache import invalidate_order_list_cache, make_order_list_key
+from .models import Order, OrderItem
+from .views import OrderCursorPagination, OrderListView
 
-# Create your tests here.
+
+class OrderFormattedAmountsTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='buyer', password='pass')
+        product = Product.objects.create(name='Watch', price=Decimal('1500.00'))
+        self.order = Order.objects.create(
+            user=user,
+            total_amount=Decimal('3000.00'),
+            amount_paid=Decimal('5000.00'),
+        )
+        self.item = OrderItem.objects.create(
+            order=self.order,
+            product=product,
+            product_name=product.name,
+            product_price=product.price,
+            quantity=2,
+        )
+
+    def test_update_fields_save_persists_order_formatted_amounts(self):
+        self.order.amount_paid = Decimal('12500.00')
+        self.order.save(update_fields=['amount_paid'])
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.formatted_paid, 'UGX 12,500.00')
+
+    def test_update_fields_save_persists_item_computed_fields(self):
+        self.item.quantity = 3
+        self.item.save(update_fields=['quantity'])
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.subtotal, Decimal('4500.00'))
+        self.assertEqual(self.item.formatted_subtotal, 'UGX 4,500.00')
+
+
+@mock.patch.object(OrderCursorPagination, 'page_size', 2)
+class OrderListViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(username='buyer', password='pass')
+        self.orders = [
+            Order.objects.create(
+                user=self.user,
+                total_amount=Decimal('100.00'),
+                amount_paid=Decimal('100.00'),
+            )
+            for _ in range(3)
+        ]
+
+    def get(self, url='/orders/'):
+        request = self.factory.get(url)
+        force_authenticate(request, user=self.user)
+        return OrderListView.as_view()(request)
+
+    def test_pages_follow_cursor(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(
+            [order['id'] for order in first.data['data']],
+            [self.orders[2].id, self.orders[1].id]
+        )
+        self.assertIsNone(first.data['pagination']['previous'])
+
+        next_url = urlparse(first.data['pagination']['next'])
+        second = self.get(f"{next_url.path}?{next_url.query}")
+        self.assertEqual([order['id'] for order in second.data['data']], [self.orders[0].id])
+        self.assertIsNone(second.data['pagination']['next'])
+
+    def test_cached_until_invalidated(self):
+        self.get()
+        Order.objects.create(
+            user=self.user,
+            total_amount=Decimal('50.00'),
+            amount_paid=Decimal('50.00'),
+        )
+        with self.assertNumQueries(0):
+            cached = self.get()
+        self.assertEqual(cached.data['data'][0]['id'], self.orders[2].id)
+
+        invalidate_order_list_cache(self.user.id)
+        fresh = self.get()
+        self.assertNotEqual(fresh.data['data'][0]['id'], self.orders[2].id)
+
+
+class OrderListCacheKeyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_client_values_do_not_leak_into_key(self):
+        key = make_order_list_key(1, 'pending x', 'c' * 500 + '\n')
+        self.assertLess(len(key), 100)
+        self.assertTrue(key.isprintable())
+        self.assertNotIn(' ', key)
+
+    def test_distinct_params_get_distinct_keys(self):
+        self.assertNotEqual(make_order_list_key(1, 'pending', ''), make_order_list_key(1, 'pending', 'abc'))
+        self.assertNotEqual(make_order_list_key(1, None, ''), make_order_list_key(1, 'completed', ''))
+        self.assertEqual(make_order_list_key(1, None, 'abc'), make_order_list_key(1, None, 'abc'))
@@ -2,14 +2,21 @@ from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import CursorPagination
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count
 from decimal import Decimal
 from .models import Order, OrderItem
 from .serializers import (
-    OrderSerializer,
     OrderListSerializer,
     CheckoutSerializer
 )
+from .cache import (
+    ORDER_LIST_CACHE_TIMEOUT,
+    make_order_list_key,
+    invalidate_order_list_cache
+)
 from cart.models import Cart, CartItem
 from products.models import Product
 import logging
@@ -17,33 +24,58 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class OrderCursorPagination(CursorPagination):
+    """Keyset pagination over order history, newest first."""
+    page_size = 50
+    ordering = '-created_at'
+
+
 class OrderListView(APIView):
     """
     Retrieve all orders for the current user.
     GET: Returns user's order history with optional status filtering.
+    Results are cursor-paginated so long histories stay bounded in memory.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = OrderCursorPagination
     
     def get(self, request):
         """
         List all orders for current user.
         Supports filtering by status.
         """
+        order_status = request.query_params.get('status', None)
+        cursor = request.query_params.get('cursor', '')
+        
+        cache_key = make_order_list_key(request.user.id, order_status, cursor)
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return Response({'success': True, **payload})
+        
+        # Only the columns OrderListSerializer renders
         queryset = Order.objects.filter(
             user=request.user
-        ).prefetch_related('items', 'items__product').order_by('-created_at')
+        ).only(
+            'id', 'status', 'total_amount', 'formatted_total', 'created_at', 'completed_at'
+        ).annotate(item_count=Count('items')).order_by('-created_at')
         
         # Filter by status if provided
-        order_status = request.query_params.get('status', None)
         if order_status:
             queryset = queryset.filter(status=order_status)
         
-        serializer = OrderListSerializer(queryset, many=True)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = OrderListSerializer(page, many=True)
+        payload = {
+            'data': serializer.data,
+            'pagination': {
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+            }
+        }
+        cache.set(cache_key, payload, ORDER_LIST_CACHE_TIMEOUT)
         
-        return Response({
-            'success': True,
-            'data': serializer.data
-        })
+        return Response({'success': True, **payload})
 
 
 class OrderDetailView(APIView):
@@ -56,20 +88,17 @@ class OrderDetailView(APIView):
     def get(self, request, pk):
         """Get detailed order information."""
         try:
-            order = Order.objects.prefetch_related(
-                'items', 'items__product'
-            ).get(id=pk, user=request.user)
+            order = Order.objects.get(id=pk, user=request.user)
         except Order.DoesNotExist:
             return Response({
                 'success': False,
                 'error': 'Order not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        serializer = OrderSerializer(order)
-        
+        # to_dict loads the items with their products in a single query
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': order.to_dict()
         })
 
 
@@ -77,6 +106,8 @@ class CheckoutView(APIView):
     """
     Process checkout and create a new order.
     POST: Creates an order from cart with payment validation and stock management.
+    Written against the planned Cart.user / CartItem.product / Product stock schema
+    (see the commented-out Product model); not reachable on the current models.
     """
     permission_classes = [IsAuthenticated]
     
@@ -94,7 +125,6 @@ class CheckoutView(APIView):
             # Get user's cart
             try:
                 cart = Cart.objects.prefetch_related(
-                    'items',
                     'items__product'
                 ).get(user=request.user)
             except Cart.DoesNotExist:
@@ -118,7 +148,7 @@ class CheckoutView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             # Calculate cart total using functional programming
-            cart_total = cart.calculate_total()
+            cart_total = cart.calculate_total
             
             # Validate payment amount
             if amount_paid < cart_total:
@@ -139,14 +169,20 @@ class CheckoutView(APIView):
                     }
                 }, status=status.HTTP_400_BAD_REQUEST)
             
+            # Lock the product rows so concurrent checkouts cannot oversell,
+            # and validate against the freshly locked stock levels
+            product_ids = [cart_item.product_id for cart_item in cart_items]
+            product_map = Product.objects.select_for_update().in_bulk(product_ids)
+            
             # Validate stock availability for all items
             stock_errors = []
             for cart_item in cart_items:
-                if not cart_item.product.can_fulfill_quantity(cart_item.quantity):
+                product = product_map[cart_item.product_id]
+                if not product.can_fulfill_quantity(cart_item.quantity):
                     stock_errors.append({
-                        'product': cart_item.product.name,
+                        'product': product.name,
                         'requested': cart_item.quantity,
-                        'available': cart_item.product.stock_quantity
+                        'available': product.stock_quantity
                     })
             
             if stock_errors:
@@ -167,18 +203,25 @@ class CheckoutView(APIView):
                 status='pending'
             )
             
-            # Create order items and reduce stock
+            # Create order items in a single INSERT.
+            # bulk_create skips OrderItem.save(), so compute derived fields here.
+            order_items = []
             for cart_item in cart_items:
-                OrderItem.objects.create(
+                product = product_map[cart_item.product_id]
+                order_item = OrderItem(
                     order=order,
-                    product=cart_item.product,
-                    product_name=cart_item.product.name,
-                    product_price=cart_item.product.price,
+                    product=product,
+                    product_name=product.name,
+                    product_price=product.price,
                     quantity=cart_item.quantity
                 )
-                
-                # Reduce stock using atomic operation
-                cart_item.product.reduce_stock(cart_item.quantity)
+                order_item.set_computed_fields()
+                order_items.append(order_item)
+            OrderItem.objects.bulk_create(order_items, batch_size=500)
+            
+            # Reduce stock using atomic operation
+            for cart_item in cart_items:
+                product_map[cart_item.product_id].reduce_stock(cart_item.quantity)
             
             # Complete order (calculates change)
             order.complete()
@@ -186,6 +229,10 @@ class CheckoutView(APIView):
             # Clear cart
             cart.clear()
             
+            # Drop cached order lists once the new order is committed
+            user_id = request.user.id
+            transaction.on_commit(lambda: invalidate_order_list_cache(user_id))
+            
             logger.info(
                 f"Order #{order.id} completed for {request.user.username}. "
                 f"Total: UGX {cart_total:,.2f}, Paid: UGX {amount_paid:,.2f}, "
@@ -202,11 +249,11 @@ class CheckoutView(APIView):
                 'order': order_data,
                 'payment_details': {
                     'total_amount': str(cart_total),
-                    'formatted_total': f'UGX {cart_total:,.2f}',
+                    'formatted_total': order.formatted_total,
                     'amount_paid': str(amount_paid),
-                    'formatted_paid': f'UGX {amount_paid:,.2f}',
+                    'formatted_paid': order.formatted_paid,
                     'change': str(order.change_amount),
-                    'formatted_change': f'UGX {order.change_amount:,.2f}'
+                    'formatted_change': order.formatted_change
                 }
             }
         }, status=status.HTTP_201_CREATED)
\ No newline at end of file
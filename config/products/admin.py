@@ -35,4 +35,5 @@ from .models import Item
 
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
-    list_display = ['name']
\ No newline at end of file
+    list_display = ['name']
+    list_per_page = 50
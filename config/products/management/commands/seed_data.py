@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from products.models import Product
 from decimal import Decimal
 
@@ -33,23 +34,35 @@ class Command(BaseCommand):
             },
         ]
         
-        created_count = 0
+        # One SELECT to find what is already seeded, one batched INSERT for the rest
+        existing = set(
+            Product.objects.filter(
+                name__in=[p['name'] for p in products]
+            ).values_list('name', flat=True)
+        )
+        
+        # Report in seed-list order so output is stable between runs
         for product_data in products:
-            product, created = Product.objects.get_or_create(
-                name=product_data['name'],
-                defaults=product_data
-            )
-            
-            if created:
-                created_count += 1
+            if product_data['name'] in existing:
                 self.stdout.write(
-                    self.style.SUCCESS(f'✓ Created: {product.name}')
-                )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f'- Already exists: {product.name}')
+                    self.style.WARNING(f"- Already exists: {product_data['name']}")
                 )
         
+        new_products = [
+            Product(**product_data)
+            for product_data in products
+            if product_data['name'] not in existing
+        ]
+        
+        with transaction.atomic():
+            Product.objects.bulk_create(new_products, batch_size=200)
+        
+        for product in new_products:
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Created: {product.name}')
+            )
+        created_count = len(new_products)
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f'\n✓ Seeding complete! Created {created_count} new products.'
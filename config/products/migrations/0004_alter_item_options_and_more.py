@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2026-10-14 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_item_price'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='item',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['-created_at'], name='products_it_created_96f0b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['name'], name='products_it_name_1ce201_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 # from django.core.validators import MinValueValidator
+# from django.db.models import F
+# from django.utils import timezone
 # from decimal import Decimal
 
 
@@ -57,14 +59,24 @@ from django.db import models
 #     def reduce_stock(self, quantity):
 #         """
 #         Reduce stock by specified quantity.
-#         Implements validation and atomic update.
+#         Checks and decrements in one conditional UPDATE, so concurrent orders cannot oversell.
 #         """
-#         if not self.can_fulfill_quantity(quantity):
-#             raise ValueError(f"Insufficient stock. Available: {self.stock_quantity}, Requested: {quantity}")
+#         if not isinstance(quantity, int) or quantity <= 0:
+#             raise ValueError(f"Invalid quantity: {quantity}")
+        
+#         updated = Product.objects.filter(
+#             pk=self.pk,
+#             stock_quantity__gte=quantity
+#         ).update(
+#             stock_quantity=F('stock_quantity') - quantity,
+#             total_ordered=F('total_ordered') + quantity,
+#             updated_at=timezone.now()
+#         )
+#         if not updated:
+#             raise ValueError(f"Insufficient stock. Requested: {quantity}")
         
 #         self.stock_quantity -= quantity
 #         self.total_ordered += quantity
-#         self.save(update_fields=['stock_quantity', 'total_ordered', 'updated_at'])
     
 #     def restore_stock(self, quantity):
 #         """Restore stock when order is cancelled."""
@@ -82,6 +94,13 @@ class Item(models.Model):
     photo = models.ImageField(upload_to="item_photos/", blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['name']),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -1,9 +1,33 @@
 from rest_framework import serializers
-from .models import Product
+from .models import Item, Product
 from decimal import Decimal
+from copy import copy
 
+_ZERO = Decimal('0')
+_MAX_PRICE = Decimal('1000000000')  # 1 billion UGX max
 
-class ProductSerializer(serializers.ModelSerializer):
+
+class CachedFieldsMixin:
+    """
+    Build ModelSerializer fields once per class instead of per instance.
+    Each instance gets shallow copies, so only use on non-nested serializers.
+    """
+    _prebuilt_fields = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Give every subclass its own template rather than inheriting the parent's
+        cls._prebuilt_fields = None
+    
+    def get_fields(self):
+        cls = type(self)
+        if cls._prebuilt_fields is None:
+            # Built on first use: at class creation the app registry may not be ready
+            cls._prebuilt_fields = super().get_fields()
+        return {name: copy(field) for name, field in cls._prebuilt_fields.items()}
+
+
+class ProductSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Product model.
     Includes custom validation and computed fields.
@@ -42,10 +66,10 @@ class ProductSerializer(serializers.ModelSerializer):
         Validate price is positive and reasonable.
         Defensive programming for data integrity.
         """
-        if value <= Decimal('0'):
+        if value <= _ZERO:
             raise serializers.ValidationError("Price must be greater than zero.")
         
-        if value > Decimal('1000000000'):  # 1 billion UGX max
+        if value > _MAX_PRICE:
             raise serializers.ValidationError("Price is unreasonably high.")
         
         return value
@@ -58,7 +82,7 @@ class ProductSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for product lists.
     Optimized for performance with minimal fields.
@@ -82,4 +106,25 @@ class ProductListSerializer(serializers.ModelSerializer):
         return obj.is_in_stock()
     
     def get_formatted_price(self, obj):
-        return f"UGX {obj.price:,.2f}"
\ No newline at end of file
+        return f"UGX {obj.price:,.2f}"
+
+
+class ItemCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Input serializer for creating an Item.
+    Parses and coerces the request body in a single pass.
+    """
+    
+    class Meta:
+        model = Item
+        fields = ['name', 'description', 'photo', 'price']
+
+
+class ItemBulkCreateSerializer(ItemCreateSerializer):
+    """
+    Input serializer for one entry of a bulk item create.
+    Photos need a storage write per file, so they are not accepted in bulk.
+    """
+    
+    class Meta(ItemCreateSerializer.Meta):
+        fields = ['name', 'description', 'price']
@@ -1,6 +1,13 @@
 from .models import Item
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.conf import settings
 from django.db.models import QuerySet
+from django.utils.encoding import filepath_to_uri
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class ItemService:
     @staticmethod
@@ -16,47 +23,81 @@ class ItemService:
                 price=price
             )
             return item
-        except Exception as e:
-            print(e)
-            raise e
+        except Exception:
+            logger.exception("create_item failed")
+            raise
     
     @staticmethod
-    def fetch_items(limit: int = 100) -> QuerySet[Item]:
+    def bulk_create_items(items: list[dict]) -> list[Item]:
         """
-        Fetch items from DB. Optional limit.
+        Create many items in batched INSERTs within one transaction.
+        Expects ItemBulkCreateSerializer validated_data; skips save() and its signals.
         """
-        return Item.objects.all()[:limit]
+        if any(not data.get("name") for data in items):
+            raise ValidationError("Name is required")
+        
+        objs = [Item(**data) for data in items]
+        with transaction.atomic():
+            return Item.objects.bulk_create(objs, batch_size=200)
     
-    def update(self, request, id):
-        try:
-            item = Item.objects.get(pk=int(id))
-        except Item.DoesNotExist:
-            return {
-                "message": "Item not found",
-                "success": False,
-            }
+    @staticmethod
+    def fetch_items(limit: int | None = 100, with_photo: bool = True, after_id: int | None = None) -> QuerySet[dict]:
+        """
+        Fetch items from DB as plain dicts, ordered by id. Optional limit.
+        after_id gives keyset pagination; with_photo=True includes the stored photo name.
+        """
+        fields = ['id', 'name', 'description', 'price']
+        if with_photo:
+            fields.append('photo')
+        items = Item.objects.order_by('id')
+        if after_id is not None:
+            items = items.filter(id__gt=after_id)
+        items = items.values(*fields)
+        return items if limit is None else items[:limit]
+    
+    @staticmethod
+    def build_photo_url(name: str) -> str | None:
+        """
+        Build the public URL for a stored photo name without an ImageFieldFile.
+        Mirrors FileSystemStorage.url(), so it is only correct for the default file system storage.
+        """
+        if not name:
+            return None
+        return f"{settings.BACKEND_URL}{settings.MEDIA_URL}{filepath_to_uri(name)}"
+    
+    @staticmethod
+    def update(request, id):
+        not_found = {
+            "message": "Item not found",
+            "success": False,
+        }
 
         # Update text fields only if provided
-        if "name" in request.data:
-            item.name = request.data.get("name")
-
-        if "description" in request.data:
-            item.description = request.data.get("description")
-
-        if "price" in request.data:
-            item.price = request.data.get("price")
+        updates = {
+            field: request.data.get(field)
+            for field in ("name", "description", "price")
+            if field in request.data
+        }
 
-        # Update photo ONLY if a new file was uploaded
+        # Update photo ONLY if a new file was uploaded; the file needs a
+        # storage write, so go through the model instead of a bare UPDATE
         if "photo" in request.FILES:
-            item.photo = request.FILES["photo"]
+            try:
+                item = Item.objects.get(pk=int(id))
+            except Item.DoesNotExist:
+                return not_found
 
-        item.save()
+            for field, value in updates.items():
+                setattr(item, field, value)
+            item.photo = request.FILES["photo"]
+            item.save()
+        else:
+            items = Item.objects.filter(pk=int(id))
+            found = items.update(**updates) if updates else items.exists()
+            if not found:
+                return not_found
 
         return {
             "message": f"Updated {id} successfully",
             "success": True,
         }
-
-        
-        
-    
@@ -1,3 +1,143 @@
-from django.test import TestCase
+import json
+from unittest import mock
+from django.conf import settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from .models import Item
+from .services import ItemService
 
-# Create your tests here.
+
+class ListItemsViewTests(APITestCase):
+    def test_photo_urls_match_storage_urls(self):
+        plain = Item.objects.create(name='Plain', price=100)
+        spaced = Item.objects.create(name='Spaced', price=200, photo='item_photos/my pic é.png')
+
+        response = self.client.get(reverse('list-items'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        photos = {row['id']: row['photo'] for row in response.json()}
+        self.assertIsNone(photos[plain.id])
+        self.assertEqual(
+            photos[spaced.id],
+            f"{settings.BACKEND_URL}{Item.objects.get(pk=spaced.pk).photo.url}"
+        )
+        self.assertTrue(photos[spaced.id].endswith('/media/item_photos/my%20pic%20%C3%A9.png'))
+
+    def test_thumbnail_zero_omits_photos(self):
+        Item.objects.create(name='Spaced', price=200, photo='item_photos/a.png')
+        response = self.client.get(reverse('list-items'), {'thumbnail': '0'})
+        self.assertEqual([row['photo'] for row in response.json()], [None])
+
+    def test_stream_returns_ndjson_rows(self):
+        first = Item.objects.create(name='First', price=100)
+        second = Item.objects.create(name='Second', price=200)
+
+        response = self.client.get(reverse('list-items'), {'stream': '1'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [first.id, second.id])
+
+    def test_stream_error_is_logged_and_ends_stream(self):
+        Item.objects.create(name='First', price=100)
+        Item.objects.create(name='Second', price=200)
+        failing_url = mock.Mock(side_effect=[None, RuntimeError('boom')])
+
+        with mock.patch.object(ItemService, 'build_photo_url', failing_url):
+            response = self.client.get(reverse('list-items'), {'stream': '1'})
+            with self.assertLogs('products.views', level='ERROR'):
+                body = b''.join(response.streaming_content)
+        self.assertEqual(len(body.splitlines()), 1)
+
+
+class ListItemsPaginationTests(APITestCase):
+    def setUp(self):
+        self.items = [Item.objects.create(name=f'Item {n}', price=n) for n in range(3)]
+
+    def test_first_page_links_to_next(self):
+        response = self.client.get(reverse('list-items'), {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.json()], [self.items[0].id, self.items[1].id])
+        self.assertIn(f'cursor={self.items[1].id}', response['Link'])
+        self.assertTrue(response['Link'].endswith('; rel="next"'))
+
+    def test_follow_up_page_is_last(self):
+        first = self.client.get(reverse('list-items'), {'page_size': 2})
+        next_url = first['Link'].split(';')[0].strip('<>')
+        response = self.client.get(next_url)
+        self.assertEqual([row['id'] for row in response.json()], [self.items[2].id])
+        self.assertFalse(response.has_header('Link'))
+
+    def test_bad_params_are_rejected_cleanly(self):
+        for params in ({'cursor': 'x'}, {'page_size': 'x'}, {'page_size': '0'}, {'cursor': '-1'}):
+            response = self.client.get(reverse('list-items'), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertNotIn('invalid literal', response.data['error'])
+
+
+class BulkAddItemsViewTests(APITestCase):
+    def post(self, data):
+        return self.client.post(reverse('bulk-add-items'), data, format='json')
+
+    def test_creates_items(self):
+        response = self.post([{'name': 'Mug', 'price': 3}, {'name': 'Cup', 'description': 'Tall'}])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(Item.objects.order_by('id').values_list('id', 'name', 'price')),
+            [(response.data['ids'][0], 'Mug', 3), (response.data['ids'][1], 'Cup', 0)]
+        )
+
+    def test_ignores_photo_and_id(self):
+        response = self.post([{'id': 999, 'name': 'Mug', 'photo': '../../etc/passwd'}])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        item = Item.objects.get()
+        self.assertNotEqual(item.id, 999)
+        self.assertFalse(item.photo)
+
+    def test_rejects_invalid_entries_without_creating_any(self):
+        response = self.post([{'name': 'Mug'}, {'name': 'Cup', 'price': 'abc'}, {'price': 1}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data['error']
+        self.assertEqual(errors[0], {})
+        self.assertIn('price', errors[1])
+        self.assertIn('name', errors[2])
+        self.assertFalse(Item.objects.exists())
+
+    def test_rejects_non_list_body(self):
+        response = self.post({'name': 'Mug'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('non_field_errors', response.data['error'])
+        self.assertFalse(Item.objects.exists())
+
+
+class ItemWriteViewsTests(APITestCase):
+    def setUp(self):
+        self.item = Item.objects.create(name='Mug', description='Blue', price=100)
+
+    def test_add_item_validates_input(self):
+        response = self.client.post(reverse('add-item'), {'name': 'Cup', 'price': '12'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Item.objects.get(pk=response.data['id']).price, 12)
+
+        response = self.client.post(reverse('add-item'), {'price': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['error']), {'name', 'price'})
+
+    def test_update_writes_only_provided_fields(self):
+        response = self.client.post(
+            reverse('update-item', args=[self.item.id]), {'price': '250'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.item.refresh_from_db()
+        self.assertEqual((self.item.name, self.item.description, self.item.price), ('Mug', 'Blue', 250))
+
+    def test_update_missing_item_fails(self):
+        response = self.client.post(reverse('update-item', args=[999]), {'name': 'X'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def test_delete_item(self):
+        response = self.client.delete(reverse('delete-item', args=[self.item.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Item.objects.exists())
+
+        response = self.client.delete(reverse('delete-item', args=[self.item.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -13,13 +13,16 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from .services import ItemService
-from django.conf import settings
+from .serializers import ItemBulkCreateSerializer, ItemCreateSerializer
+from django.http import StreamingHttpResponse
+from rest_framework.utils.urls import replace_query_param
+from config.renderers import ORJSONRenderer
 from .models import Item
 import logging
 
 logger = logging.getLogger(__name__)
 
-_itemService = ItemService()
+
 class AddItemView(APIView):
     """
     Create a new item with photo upload.
@@ -33,13 +36,12 @@ class AddItemView(APIView):
         Accepts multipart/form-data or JSON.
         """
         try:
-            # Multipart/form-data (for file upload)
-            name = request.data.get("name")
-            description = request.data.get("description", "")
-            photo = request.FILES.get("photo")  # None if not uploaded
-            price = request.data.get('price')
+            # Multipart/form-data (for file upload) or JSON, validated in one pass
+            serializer = ItemCreateSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
-            item = ItemService.create_item(name=name, description=description, photo=photo, price=price)
+            item = ItemService.create_item(**serializer.validated_data)
 
             return Response(
                 {"id": item.id, "message": "Item created successfully"},
@@ -51,34 +53,122 @@ class AddItemView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class BulkAddItemsView(APIView):
+    """
+    Create several items in one request.
+    POST: Accepts a JSON list of items (no photo uploads).
+    """
+    permission_classes = [AllowAny]
+    
+    def post(self, request):
+        """
+        Add Items in bulk.
+        """
+        serializer = ItemBulkCreateSerializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            items = ItemService.bulk_create_items(serializer.validated_data)
+        except Exception:
+            logger.exception("Error bulk creating items")
+            return Response(
+                {"error": "Could not create items"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        return Response(
+            {"ids": [item.id for item in items], "message": f"{len(items)} items created successfully"},
+            status=status.HTTP_201_CREATED
+        )
+
+
 class ListItemsView(APIView):
     """
     Retrieve all items with optional photo URL.
-    GET: Returns a list of all items.
+    GET: Returns a page of items; a Link rel="next" header points to the next page
+    (?cursor=<last id>&page_size=N). ?stream=1 exports every item as newline-delimited JSON.
     """
     permission_classes = [AllowAny]
+    max_page_size = 500
     
     def get(self, request):
         """
         Fetch items.
         """
+        # ?thumbnail=0 skips loading photos entirely
+        with_photo = request.query_params.get('thumbnail') != '0'
+        stream = request.query_params.get('stream') == '1'
         try:
-            items = ItemService.fetch_items()
-            # Convert to simple dicts for JSON response
-            data = [
-                {
-                    "id": i.id,
-                    "name": i.name,
-                    "description": i.description,
-                    'photo': f"{settings.BACKEND_URL}{i.photo.url}" if i.photo else None,
-                    'price': i.price
-                }
-                for i in items
-            ]
-            return Response(data, status=status.HTTP_200_OK)
+            after_id = self.parse_int_param(request, 'cursor', None, minimum=0)
+            page_size = self.parse_int_param(request, 'page_size', 100, minimum=1)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            if stream:
+                # One-shot export: no page limit, larger fetch chunks
+                limit, chunk_size = None, 2000
+            else:
+                # Fetch one extra row to tell whether another page exists
+                page_size = min(page_size, self.max_page_size)
+                limit, chunk_size = page_size + 1, 500
+            
+            items = ItemService.fetch_items(limit=limit, with_photo=with_photo, after_id=after_id)
+            
+            def rows():
+                # Convert to simple dicts for JSON response, streaming from the cursor
+                for i in items.iterator(chunk_size=chunk_size):
+                    yield {
+                        "id": i['id'],
+                        "name": i['name'],
+                        "description": i['description'],
+                        'photo': ItemService.build_photo_url(i.get('photo')),
+                        'price': i['price']
+                    }
+            
+            if stream:
+                return StreamingHttpResponse(
+                    self.stream_rows(rows()),
+                    content_type='application/x-ndjson'
+                )
+            
+            data = list(rows())
+            headers = {}
+            if len(data) > page_size:
+                data = data[:page_size]
+                next_url = replace_query_param(
+                    request.build_absolute_uri(), 'cursor', data[-1]['id']
+                )
+                headers['Link'] = f'<{next_url}>; rel="next"'
+            return Response(data, status=status.HTTP_200_OK, headers=headers)
         except Exception as e:
             logger.error(f"Error fetching items: {str(e)}")
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    @staticmethod
+    def parse_int_param(request, name, default, minimum):
+        """Read an optional integer query param, raising ValueError with a clean message."""
+        value = request.query_params.get(name)
+        if value in (None, ''):
+            return default
+        if not value.isdigit() or int(value) < minimum:
+            raise ValueError(f"{name} must be an integer of at least {minimum}")
+        return int(value)
+    
+    @staticmethod
+    def stream_rows(rows):
+        """
+        Encode rows as newline-delimited JSON with the API's JSON encoder.
+        Runs after get() has returned, so a failure here is logged and ends the
+        stream early; the client sees a truncated 200 rather than an error status.
+        """
+        renderer = ORJSONRenderer()
+        try:
+            for row in rows:
+                yield renderer.render(row) + b"\n"
+        except Exception:
+            logger.exception("Error streaming items")
 
 
 class DeleteItemView(APIView):
@@ -93,15 +183,15 @@ class DeleteItemView(APIView):
         Delete an item.
         """
         try:
-            item = Item.objects.get(id=id)
-            item.delete()
+            # Delete by primary key without loading the item first
+            deleted, _ = Item.objects.filter(pk=id).delete()
+            if not deleted:
+                return Response(
+                    {"error": "Item not found"},
+                    status=status.HTTP_404_NOT_FOUND
+                )
             return Response({"success": True},
                 status=status.HTTP_200_OK)
-        except Item.DoesNotExist:
-            return Response(
-                {"error": "Item not found"},
-                status=status.HTTP_404_NOT_FOUND
-            )
         except Exception as e:
             logger.error(f"Error deleting item: {str(e)}")
             return Response(
@@ -114,7 +204,7 @@ class UpdateItemView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request, id):
-        update = _itemService.update(request, id)
+        update = ItemService.update(request, id)
         if update['success'] == False:
             return Response({
                 "message": "an error occured"